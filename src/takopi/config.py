@@ -1,7 +1,9 @@
 from __future__ import annotations
 
+import copy
 import tomllib
 from dataclasses import dataclass, field
+from functools import lru_cache
 import os
 from pathlib import Path
 import tempfile
@@ -34,19 +36,30 @@ def ensure_table(
     return value
 
 
+@lru_cache(maxsize=8)
+def _parse_config_cached(
+    path: str, mtime_ns: int, size: int, inode: int
+) -> dict[str, Any]:
+    return tomllib.loads(Path(path).read_text(encoding="utf-8"))
+
+
 def read_config(cfg_path: Path) -> dict:
     if cfg_path.exists() and not cfg_path.is_file():
         raise ConfigError(f"Config path {cfg_path} exists but is not a file.") from None
     try:
-        raw = cfg_path.read_text(encoding="utf-8")
+        stat = cfg_path.stat()
+        parsed = _parse_config_cached(
+            str(cfg_path), stat.st_mtime_ns, stat.st_size, stat.st_ino
+        )
     except FileNotFoundError:
         raise ConfigError(f"Missing config file {cfg_path}.") from None
     except OSError as e:
         raise ConfigError(f"Failed to read config file {cfg_path}: {e}") from e
-    try:
-        return tomllib.loads(raw)
     except tomllib.TOMLDecodeError as e:
         raise ConfigError(f"Malformed TOML in {cfg_path}: {e}") from None
+    # Callers mutate the returned table (migrations, `config set`), so never
+    # hand out the cached object itself.
+    return copy.deepcopy(parsed)
 
 
 def load_or_init_config(path: str | Path | None = None) -> tuple[dict, Path]:
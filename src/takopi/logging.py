@@ -50,6 +50,14 @@ def pipeline_log_level() -> str:
     return _PIPELINE_LEVEL_NAME
 
 
+def debug_enabled() -> bool:
+    return _LEVELS["debug"] >= _MIN_LEVEL
+
+
+def pipeline_enabled() -> bool:
+    return _LEVELS[_PIPELINE_LEVEL_NAME] >= _MIN_LEVEL
+
+
 def log_pipeline(logger: Any, event: str, **fields: Any) -> None:
     if _PIPELINE_LEVEL_NAME == "info":
         logger.info(event, **fields)
@@ -70,6 +78,9 @@ def _drop_below_level(
 
 
 def _redact_text(value: str) -> str:
+    # Both token shapes contain a colon, so most log strings can skip the scans.
+    if ":" not in value:
+        return value
     redacted = TELEGRAM_TOKEN_RE.sub("bot[REDACTED]", value)
     return TELEGRAM_BARE_TOKEN_RE.sub("[REDACTED_TOKEN]", redacted)
 
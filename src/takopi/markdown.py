@@ -17,6 +17,12 @@ HARD_BREAK = "  \n"
 MAX_PROGRESS_CMD_LEN = 300
 MAX_FILE_CHANGES_INLINE = 3
 
+ACTION_TITLE_PREFIXES: dict[str, str] = {
+    "tool": "tool: ",
+    "web_search": "searched: ",
+    "subagent": "subagent: ",
+}
+
 
 @dataclass(frozen=True, slots=True)
 class MarkdownParts:
@@ -49,9 +55,7 @@ def format_elapsed(elapsed_s: float) -> str:
 def format_header(
     elapsed_s: float, item: int | None, *, label: str, engine: str
 ) -> str:
-    elapsed = format_elapsed(elapsed_s)
-    parts = [label, engine]
-    parts.append(elapsed)
+    parts = [label, engine, format_elapsed(elapsed_s)]
     if item is not None:
         parts.append(f"step {item}")
     return HEADER_SEP.join(parts)
@@ -130,25 +134,16 @@ def format_file_change_title(action: Action, *, command_width: int | None) -> st
 
 
 def format_action_title(action: Action, *, command_width: int | None) -> str:
-    title = str(action.title or "")
     kind = action.kind
-    if kind == "command":
-        title = shorten(title, command_width)
-        return f"`{title}`"
-    if kind == "tool":
-        title = shorten(title, command_width)
-        return f"tool: {title}"
-    if kind == "web_search":
-        title = shorten(title, command_width)
-        return f"searched: {title}"
-    if kind == "subagent":
-        title = shorten(title, command_width)
-        return f"subagent: {title}"
     if kind == "file_change":
         return format_file_change_title(action, command_width=command_width)
-    if kind in {"note", "warning"}:
-        return shorten(title, command_width)
-    return shorten(title, command_width)
+    title = shorten(str(action.title or ""), command_width)
+    if kind == "command":
+        return f"`{title}`"
+    prefix = ACTION_TITLE_PREFIXES.get(kind)
+    if prefix is None:
+        return title
+    return f"{prefix}{title}"
 
 
 def format_action_line(
@@ -249,8 +244,9 @@ class MarkdownFormatter:
         return HARD_BREAK.join(lines)
 
     def _format_actions(self, state: ProgressState) -> list[str]:
-        actions = list(state.actions)
-        actions = [] if self.max_actions == 0 else actions[-self.max_actions :]
+        if self.max_actions == 0:
+            return []
+        actions = state.actions[-self.max_actions :]
         return [
             format_action_line(
                 action_state.action,
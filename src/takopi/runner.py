@@ -2,7 +2,6 @@
 
 from __future__ import annotations
 
-import json
 import re
 import subprocess
 from collections.abc import AsyncIterator, Callable
@@ -11,6 +10,7 @@ from typing import Any, Protocol, cast
 from weakref import WeakValueDictionary
 
 import anyio
+import msgspec
 
 from .logging import get_logger, log_pipeline
 from .model import (
@@ -26,6 +26,11 @@ from .utils.paths import get_run_base_dir
 from .utils.streams import drain_stderr, iter_bytes_lines
 from .utils.subprocess import manage_subprocess
 
+logger = get_logger(__name__)
+
+_JSONL_DECODER = msgspec.json.Decoder()
+_MAX_NOTE_LINE_CHARS = 200
+
 
 class ResumeTokenMixin:
     engine: EngineId
@@ -142,7 +147,7 @@ class JsonlStreamState:
 
 class JsonlSubprocessRunner(BaseRunner):
     def get_logger(self) -> Any:
-        return getattr(self, "logger", get_logger(__name__))
+        return getattr(self, "logger", logger)
 
     def command(self) -> str:
         raise NotImplementedError
@@ -228,13 +233,21 @@ class JsonlSubprocessRunner(BaseRunner):
         state: Any,
     ) -> list[TakopiEvent]:
         message = f"invalid JSON from {self.tag()}; ignoring line"
-        return [self.note_event(message, state=state, detail={"line": line})]
+        detail = {"line": line[:_MAX_NOTE_LINE_CHARS]}
+        return [self.note_event(message, state=state, detail=detail)]
 
     def decode_jsonl(self, *, line: bytes) -> Any | None:
-        text = line.decode("utf-8", errors="replace")
+        if line[:1] not in (b"{", b"["):
+            return None
+        try:
+            return cast(dict[str, Any], _JSONL_DECODER.decode(line))
+        except UnicodeDecodeError:
+            line = line.decode("utf-8", errors="replace").encode()
+        except msgspec.DecodeError:
+            return None
         try:
-            return cast(dict[str, Any], json.loads(text))
-        except json.JSONDecodeError:
+            return cast(dict[str, Any], _JSONL_DECODER.decode(line))
+        except msgspec.DecodeError:
             return None
 
     async def iter_json_lines(
@@ -242,7 +255,7 @@ class JsonlSubprocessRunner(BaseRunner):
         stream: Any,
     ) -> AsyncIterator[bytes]:
         async for raw_line in iter_bytes_lines(stream):
-            yield raw_line.rstrip(b"\n")
+            yield raw_line
 
     def decode_error_events(
         self,
@@ -253,7 +266,7 @@ class JsonlSubprocessRunner(BaseRunner):
         state: Any,
     ) -> list[TakopiEvent]:
         message = f"invalid event from {self.tag()}; ignoring line"
-        detail = {"line": line, "error": str(error)}
+        detail = {"line": line[:_MAX_NOTE_LINE_CHARS], "error": str(error)}
         return [self.note_event(message, state=state, detail=detail)]
 
     def translate_error_events(
@@ -382,11 +395,11 @@ class JsonlSubprocessRunner(BaseRunner):
         logger: Any,
         pid: int,
     ) -> list[TakopiEvent]:
-        raw_text = raw_line.decode("utf-8", errors="replace")
-        line_text = line.decode("utf-8", errors="replace")
         try:
             decoded = self.decode_jsonl(line=line)
         except Exception as exc:  # noqa: BLE001
+            raw_text = raw_line.decode("utf-8", errors="replace")
+            line_text = line.decode("utf-8", errors="replace")
             log_pipeline(
                 logger,
                 "jsonl.parse.error",
@@ -402,6 +415,8 @@ class JsonlSubprocessRunner(BaseRunner):
                 state=state,
             )
         if decoded is None:
+            raw_text = raw_line.decode("utf-8", errors="replace")
+            line_text = line.decode("utf-8", errors="replace")
             log_pipeline(
                 logger,
                 "jsonl.parse.invalid",
@@ -7,7 +7,7 @@ from dataclasses import dataclass, field
 import anyio
 
 from .context import RunContext
-from .logging import bind_run_context, get_logger
+from .logging import bind_run_context, debug_enabled, get_logger
 from .model import CompletedEvent, ResumeToken, StartedEvent, TakopiEvent
 from .presenter import Presenter
 from .markdown import render_event_cli
@@ -27,6 +27,8 @@ logger = get_logger(__name__)
 
 
 def _log_runner_event(evt: TakopiEvent) -> None:
+    if not debug_enabled():
+        return
     for line in render_event_cli(evt):
         logger.debug(
             "runner.event.cli",
@@ -129,6 +129,7 @@ class Update(msgspec.Struct, forbid_unknown_fields=False):
 
 class File(msgspec.Struct, forbid_unknown_fields=False):
     file_path: str
+    file_size: int | None = None
 
 
 class ChatMember(msgspec.Struct, forbid_unknown_fields=False):
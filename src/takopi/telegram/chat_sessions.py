@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from operator import attrgetter
 from pathlib import Path
 from time import time
 
@@ -15,8 +16,10 @@ STATE_VERSION = 2  # Bumped for multi-session support
 STATE_FILENAME = "telegram_chat_sessions_state.json"
 MAX_SESSIONS_PER_CHAT = 20  # Keep last N sessions per engine
 
+_UPDATED_AT = attrgetter("updated_at")
 
-class SessionInfo(msgspec.Struct, forbid_unknown_fields=False):
+
+class SessionInfo(msgspec.Struct, forbid_unknown_fields=False, gc=False):
     """Information about a single session."""
     resume: str
     engine: str
@@ -72,6 +75,16 @@ def _migrate_chat_state(chat: _ChatState) -> None:
         chat.sessions = None
 
 
+def _sorted_sessions(chat: _ChatState, engine: str | None) -> list[SessionInfo]:
+    if engine:
+        sessions = [s for s in chat.history.values() if s.engine == engine]
+    else:
+        sessions = list(chat.history.values())
+    # Sort by updated_at descending
+    sessions.sort(key=_UPDATED_AT, reverse=True)
+    return sessions
+
+
 class ChatSessionStore(JsonStateStore[_ChatSessionsState]):
     def __init__(self, path: Path) -> None:
         super().__init__(
@@ -83,6 +96,10 @@ class ChatSessionStore(JsonStateStore[_ChatSessionsState]):
             logger=logger,
         )
 
+    def _load_locked(self) -> None:
+        super()._load_locked()
+        self._migrate_if_needed()
+
     def _migrate_if_needed(self) -> None:
         """Migrate all chats from old format."""
         for chat in self._state.chats.values():
@@ -94,7 +111,6 @@ class ChatSessionStore(JsonStateStore[_ChatSessionsState]):
         """Get the active session for an engine."""
         async with self._lock:
             self._reload_locked_if_needed()
-            self._migrate_if_needed()
             chat = self._get_chat_locked(chat_id, owner_id)
             if chat is None:
                 return None
@@ -131,7 +147,6 @@ class ChatSessionStore(JsonStateStore[_ChatSessionsState]):
         """Set or update a session. Creates new if doesn't exist."""
         async with self._lock:
             self._reload_locked_if_needed()
-            self._migrate_if_needed()
             if self._state.cwd is None:
                 self._state.cwd = str(Path.cwd().expanduser().resolve())
             chat = self._ensure_chat_locked(chat_id, owner_id)
@@ -164,9 +179,8 @@ class ChatSessionStore(JsonStateStore[_ChatSessionsState]):
         """Clear only the active session pointers, keep history."""
         async with self._lock:
             self._reload_locked_if_needed()
-            self._migrate_if_needed()
             chat = self._get_chat_locked(chat_id, owner_id)
-            if chat is None:
+            if chat is None or not chat.active:
                 return
             chat.active = {}
             self._save_locked()
@@ -177,13 +191,11 @@ class ChatSessionStore(JsonStateStore[_ChatSessionsState]):
         """Start a new session for an engine (keeps old in history)."""
         async with self._lock:
             self._reload_locked_if_needed()
-            self._migrate_if_needed()
             chat = self._get_chat_locked(chat_id, owner_id)
-            if chat is None:
+            if chat is None or engine not in chat.active:
                 return
             # Just clear the active pointer, history remains
-            if engine in chat.active:
-                del chat.active[engine]
+            del chat.active[engine]
             self._save_locked()
 
     async def list_sessions(
@@ -192,18 +204,38 @@ class ChatSessionStore(JsonStateStore[_ChatSessionsState]):
         """List all sessions, optionally filtered by engine."""
         async with self._lock:
             self._reload_locked_if_needed()
-            self._migrate_if_needed()
             chat = self._get_chat_locked(chat_id, owner_id)
             if chat is None:
                 return []
+            return _sorted_sessions(chat, engine)
 
-            sessions = list(chat.history.values())
-            if engine:
-                sessions = [s for s in sessions if s.engine == engine]
+    async def get_sessions_overview(
+        self, chat_id: int, owner_id: int | None, engine: str | None = None
+    ) -> tuple[list[SessionInfo], dict[str, str]]:
+        """List sessions like list_sessions, plus the active ID per engine."""
+        async with self._lock:
+            self._reload_locked_if_needed()
+            chat = self._get_chat_locked(chat_id, owner_id)
+            if chat is None:
+                return [], {}
+            return _sorted_sessions(chat, engine), dict(chat.active)
 
-            # Sort by updated_at descending
-            sessions.sort(key=lambda s: s.updated_at, reverse=True)
-            return sessions
+    async def find_sessions_by_prefix(
+        self, chat_id: int, owner_id: int | None, prefix: str, *, limit: int = 2
+    ) -> list[SessionInfo]:
+        """Find up to `limit` sessions whose resume ID starts with `prefix`."""
+        async with self._lock:
+            self._reload_locked_if_needed()
+            chat = self._get_chat_locked(chat_id, owner_id)
+            if chat is None:
+                return []
+            matching: list[SessionInfo] = []
+            for resume_id, session in chat.history.items():
+                if resume_id.startswith(prefix):
+                    matching.append(session)
+                    if len(matching) >= limit:
+                        break
+            return matching
 
     async def get_active_session_id(
         self, chat_id: int, owner_id: int | None, engine: str
@@ -211,7 +243,6 @@ class ChatSessionStore(JsonStateStore[_ChatSessionsState]):
         """Get the active session ID for an engine."""
         async with self._lock:
             self._reload_locked_if_needed()
-            self._migrate_if_needed()
             chat = self._get_chat_locked(chat_id, owner_id)
             if chat is None:
                 return None
@@ -223,7 +254,6 @@ class ChatSessionStore(JsonStateStore[_ChatSessionsState]):
         """Switch to a different session by resume ID."""
         async with self._lock:
             self._reload_locked_if_needed()
-            self._migrate_if_needed()
             chat = self._get_chat_locked(chat_id, owner_id)
             if chat is None:
                 return None
@@ -244,7 +274,6 @@ class ChatSessionStore(JsonStateStore[_ChatSessionsState]):
         """Set a title for the active session."""
         async with self._lock:
             self._reload_locked_if_needed()
-            self._migrate_if_needed()
             chat = self._get_chat_locked(chat_id, owner_id)
             if chat is None:
                 return False
@@ -267,7 +296,6 @@ class ChatSessionStore(JsonStateStore[_ChatSessionsState]):
         """Delete a session from history."""
         async with self._lock:
             self._reload_locked_if_needed()
-            self._migrate_if_needed()
             chat = self._get_chat_locked(chat_id, owner_id)
             if chat is None:
                 return False
@@ -287,6 +315,8 @@ class ChatSessionStore(JsonStateStore[_ChatSessionsState]):
 
     def _prune_sessions_locked(self, chat: _ChatState, engine: str) -> None:
         """Remove oldest sessions if over limit."""
+        if len(chat.history) <= MAX_SESSIONS_PER_CHAT:
+            return
         engine_sessions = [
             (rid, s) for rid, s in chat.history.items() if s.engine == engine
         ]
@@ -12,6 +12,8 @@ logger = get_logger(__name__)
 
 T = TypeVar("T")
 
+_LINK_PREVIEW_DISABLED: dict[str, Any] = {"is_disabled": True}
+
 
 class RetryAfter(Exception):
     def __init__(self, retry_after: float, description: str | None = None) -> None:
@@ -139,6 +141,7 @@ class HttpBotClient:
             raise ValueError("Telegram token is empty")
         self._base = f"https://api.telegram.org/bot{token}"
         self._file_base = f"https://api.telegram.org/file/bot{token}"
+        self._method_urls: dict[str, str] = {}
         self._http_client = http_client or httpx.AsyncClient(timeout=timeout_s)
         self._owns_http_client = http_client is None
 
@@ -146,6 +149,13 @@ class HttpBotClient:
         if self._owns_http_client:
             await self._http_client.aclose()
 
+    def _method_url(self, method: str) -> str:
+        url = self._method_urls.get(method)
+        if url is None:
+            url = f"{self._base}/{method}"
+            self._method_urls[method] = url
+        return url
+
     def _parse_telegram_envelope(
         self,
         *,
@@ -194,19 +204,18 @@ class HttpBotClient:
     ) -> Any | None:
         request_payload = json if json is not None else data
         logger.debug("telegram.request", method=method, payload=request_payload)
+        url = self._method_url(method)
         try:
             if json is not None:
-                resp = await self._http_client.post(f"{self._base}/{method}", json=json)
+                resp = await self._http_client.post(url, json=json)
             else:
-                resp = await self._http_client.post(
-                    f"{self._base}/{method}", data=data, files=files
-                )
+                resp = await self._http_client.post(url, data=data, files=files)
         except httpx.HTTPError as exc:
-            url = getattr(exc.request, "url", None)
+            request_url = getattr(exc.request, "url", None)
             logger.error(
                 "telegram.network_error",
                 method=method,
-                url=str(url) if url is not None else None,
+                url=str(request_url) if request_url is not None else None,
                 error=str(exc),
                 error_type=exc.__class__.__name__,
             )
@@ -244,7 +253,7 @@ class HttpBotClient:
             return None
 
         try:
-            response_payload = resp.json()
+            response_payload = msgspec.json.decode(resp.content)
         except Exception as exc:  # noqa: BLE001
             body = resp.text
             logger.error(
@@ -381,7 +390,11 @@ class HttpBotClient:
         *,
         replace_message_id: int | None = None,
     ) -> Message | None:
-        params: dict[str, Any] = {"chat_id": chat_id, "text": text}
+        params: dict[str, Any] = {
+            "chat_id": chat_id,
+            "text": text,
+            "link_preview_options": _LINK_PREVIEW_DISABLED,
+        }
         if disable_notification is not None:
             params["disable_notification"] = disable_notification
         if reply_to_message_id is not None:
@@ -392,7 +405,6 @@ class HttpBotClient:
             params["entities"] = entities
         if parse_mode is not None:
             params["parse_mode"] = parse_mode
-        params["link_preview_options"] = {"is_disabled": True}
         if reply_markup is not None:
             params["reply_markup"] = reply_markup
         result = await self._post("sendMessage", params)
@@ -439,12 +451,12 @@ class HttpBotClient:
             "chat_id": chat_id,
             "message_id": message_id,
             "text": text,
+            "link_preview_options": _LINK_PREVIEW_DISABLED,
         }
         if entities is not None:
             params["entities"] = entities
         if parse_mode is not None:
             params["parse_mode"] = parse_mode
-        params["link_preview_options"] = {"is_disabled": True}
         if reply_markup is not None:
             params["reply_markup"] = reply_markup
         result = await self._post("editMessageText", params)
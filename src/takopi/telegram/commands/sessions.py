@@ -12,25 +12,43 @@ if TYPE_CHECKING:
     from ..bridge import TelegramBridgeConfig
 
 
-def _format_time_ago(timestamp: float) -> str:
+_SESSIONS_FOOTER = (
+    "commands:",
+    "`/switch <id>` - switch to session",
+    "`/name <title>` - name current session",
+    "`/new` - start fresh (keeps history)",
+)
+
+
+def _format_time_ago(timestamp: float, now: int | None = None) -> str:
     """Format timestamp as relative time."""
     if timestamp == 0:
         return "unknown"
-    diff = time() - timestamp
+    if now is None:
+        now = int(time())
+    diff = now - int(timestamp)
     if diff < 60:
         return "just now"
     if diff < 3600:
-        mins = int(diff / 60)
-        return f"{mins}m ago"
+        return f"{diff // 60}m ago"
     if diff < 86400:
-        hours = int(diff / 3600)
-        return f"{hours}h ago"
-    days = int(diff / 86400)
-    return f"{days}d ago"
+        return f"{diff // 3600}h ago"
+    return f"{diff // 86400}d ago"
+
+
+def _elide(text: str, width: int) -> str:
+    """Truncate text to width characters, ending with "..." when cut."""
+    if len(text) <= width:
+        return text
+    return f"{text[: width - 3]}..."
 
 
 def _format_session(
-    session: SessionInfo, *, is_active: bool = False, index: int | None = None
+    session: SessionInfo,
+    *,
+    is_active: bool = False,
+    index: int | None = None,
+    now: int | None = None,
 ) -> str:
     """Format a single session for display."""
     prefix = ""
@@ -40,11 +58,9 @@ def _format_session(
     active_marker = "▸ " if is_active else "  "
     title = session.title or session.first_message or "untitled"
 
-    # Truncate title if too long
-    if len(title) > 30:
-        title = title[:27] + "..."
+    title = _elide(title, 30)
 
-    time_str = _format_time_ago(session.updated_at)
+    time_str = _format_time_ago(session.updated_at, now)
     short_id = session.resume[:8]
 
     return f"{prefix}{active_marker}`{short_id}` {title} ({time_str})"
@@ -75,49 +91,48 @@ async def handle_sessions_command(
     # Parse optional engine filter
     engine_filter = args_text.strip() if args_text.strip() else None
 
-    sessions = await store.list_sessions(chat_id, owner_id, engine=engine_filter)
+    sessions, active_ids = await store.get_sessions_overview(
+        chat_id, owner_id, engine=engine_filter
+    )
 
     if not sessions:
         await reply(text="no sessions found. start chatting to create one!")
         return
 
-    # Get active session IDs
-    active_ids: dict[str, str | None] = {}
-    for engine in set(s.engine for s in sessions):
-        active_ids[engine] = await store.get_active_session_id(chat_id, owner_id, engine)
-
     # Group by engine
     by_engine: dict[str, list[SessionInfo]] = {}
     for s in sessions:
         by_engine.setdefault(s.engine, []).append(s)
 
     lines = ["**your sessions:**\n"]
+    now = int(time())
 
     for engine, engine_sessions in by_engine.items():
         active_id = active_ids.get(engine)
         lines.append(f"**{engine}:**")
 
-        for i, session in enumerate(engine_sessions[:10], 1):  # Show max 10 per engine
-            is_active = session.resume == active_id
-            lines.append(_format_session(session, is_active=is_active, index=i))
+        # Show max 10 per engine
+        lines.extend(
+            _format_session(
+                session, is_active=session.resume == active_id, index=i, now=now
+            )
+            for i, session in enumerate(engine_sessions[:10], 1)
+        )
 
         if len(engine_sessions) > 10:
             lines.append(f"  ... and {len(engine_sessions) - 10} more")
         lines.append("")
 
-    lines.append("commands:")
-    lines.append("`/switch <id>` - switch to session")
-    lines.append("`/name <title>` - name current session")
-    lines.append("`/new` - start fresh (keeps history)")
+    lines.extend(_SESSIONS_FOOTER)
 
     # Build inline keyboard with session buttons
     keyboard = []
     for session in sessions[:6]:  # Max 6 buttons
         is_active = session.resume == active_ids.get(session.engine)
         if not is_active:
-            title = session.title or session.first_message or _short_id(session.resume)
-            if len(title) > 20:
-                title = title[:17] + "..."
+            title = _elide(
+                session.title or session.first_message or _short_id(session.resume), 20
+            )
             keyboard.append([{
                 "text": f"↩️ {title}",
                 "callback_data": f"takopi:switch:{session.resume[:32]}"
@@ -151,8 +166,7 @@ async def handle_switch_command(
         return
 
     # Try to find session by partial ID match
-    sessions = await store.list_sessions(chat_id, owner_id)
-    matching = [s for s in sessions if s.resume.startswith(resume_id)]
+    matching = await store.find_sessions_by_prefix(chat_id, owner_id, resume_id)
 
     if not matching:
         await reply(text=f"no session found matching `{resume_id}`")
@@ -223,8 +237,7 @@ async def handle_delete_command(
         return
 
     # Try to find session by partial ID match
-    sessions = await store.list_sessions(chat_id, owner_id)
-    matching = [s for s in sessions if s.resume.startswith(resume_id)]
+    matching = await store.find_sessions_by_prefix(chat_id, owner_id, resume_id)
 
     if not matching:
         await reply(text=f"no session found matching `{resume_id}`")
@@ -258,8 +271,9 @@ async def handle_switch_callback(
     chat_id, owner_id = session_key
 
     # Find session by prefix
-    sessions = await store.list_sessions(chat_id, owner_id)
-    matching = [s for s in sessions if s.resume.startswith(resume_id_prefix)]
+    matching = await store.find_sessions_by_prefix(
+        chat_id, owner_id, resume_id_prefix, limit=1
+    )
 
     if not matching:
         return f"session not found"
@@ -2,11 +2,13 @@
 
 from __future__ import annotations
 
-import json
+import os
 from collections.abc import Awaitable, Callable
 from pathlib import Path
+from typing import Any
 
 import anyio
+import msgspec
 
 from ..context import RunContext
 from ..logging import get_logger
@@ -17,6 +19,15 @@ logger = get_logger(__name__)
 SYSTEM_PREFIX = "[SYSTEM] "
 
 
+class _InjectPayload(msgspec.Struct, forbid_unknown_fields=False):
+    text: str = ""
+    # Any JSON value; truthiness decides, so null/0/"" mean no new session.
+    new_session: Any = False
+
+
+_PAYLOAD_DECODER = msgspec.json.Decoder(_InjectPayload)
+
+
 async def watch_inject_dir(
     *,
     inject_dir: Path,
@@ -41,14 +52,38 @@ async def watch_inject_dir(
     inject_dir.mkdir(parents=True, exist_ok=True)
     logger.info("inject.watcher.started", inject_dir=str(inject_dir))
 
+    last_mtime_ns: int | None = None
+    rescanned = False
     while True:
         try:
-            files = sorted(inject_dir.glob("*.json"))
-            for fpath in files:
+            try:
+                mtime_ns = inject_dir.stat().st_mtime_ns
+                # Directory mtime only moves when entries are added, removed
+                # or renamed. Scan once more after it stops moving, so a file
+                # created in the same timestamp tick as a scan is not missed.
+                if mtime_ns == last_mtime_ns:
+                    if rescanned:
+                        await anyio.sleep(poll_interval)
+                        continue
+                    rescanned = True
+                else:
+                    last_mtime_ns = mtime_ns
+                    rescanned = False
+                with os.scandir(inject_dir) as entries:
+                    names = sorted(
+                        entry.name
+                        for entry in entries
+                        if entry.name.endswith(".json") and entry.is_file()
+                    )
+            except FileNotFoundError:
+                last_mtime_ns = None
+                await anyio.sleep(poll_interval)
+                continue
+            for name in names:
+                fpath = inject_dir / name
                 try:
-                    raw = fpath.read_text(encoding="utf-8")
-                    payload = json.loads(raw)
-                except (json.JSONDecodeError, OSError) as exc:
+                    payload = _PAYLOAD_DECODER.decode(fpath.read_bytes())
+                except (msgspec.DecodeError, OSError) as exc:
                     logger.warning(
                         "inject.file.invalid",
                         path=str(fpath),
@@ -65,12 +100,12 @@ async def watch_inject_dir(
                 except OSError:
                     pass
 
-                text = payload.get("text", "").strip()
+                text = payload.text.strip()
                 if not text:
                     logger.warning("inject.file.empty_text", path=fpath.name)
                     continue
 
-                new_session = payload.get("new_session", False)
+                new_session = bool(payload.new_session)
 
                 logger.info(
                     "inject.dispatch",
@@ -78,7 +78,12 @@ from .types import (
     TelegramIncomingMessage,
     TelegramIncomingUpdate,
 )
-from .voice import transcribe_voice, SpeechCoreTranscriber
+from .voice import (
+    OpenAIVoiceTranscriber,
+    SpeechCoreTranscriber,
+    VoiceTranscriber,
+    transcribe_voice,
+)
 
 logger = get_logger(__name__)
 
@@ -499,6 +504,8 @@ class TelegramLoopState:
     seen_update_order: deque[int]
     seen_message_keys: set[MessageKey]
     seen_messages_order: deque[MessageKey]
+    speechcore_transcriber: SpeechCoreTranscriber | None = None
+    openai_transcriber: OpenAIVoiceTranscriber | None = None
 
 
 if TYPE_CHECKING:
@@ -1788,14 +1795,23 @@ async def run_main_loop(
 
                 if msg.voice is not None:
                     # Select transcriber based on provider
-                    transcriber = None
+                    transcriber: VoiceTranscriber | None = None
                     if cfg.voice_transcription_provider == "speechcore":
                         if cfg.voice_speechcore_api_key:
-                            transcriber = SpeechCoreTranscriber(
-                                api_key=cfg.voice_speechcore_api_key,
-                                language=cfg.voice_speechcore_language,
-                                diarize=cfg.voice_speechcore_diarize,
+                            if state.speechcore_transcriber is None:
+                                state.speechcore_transcriber = SpeechCoreTranscriber(
+                                    api_key=cfg.voice_speechcore_api_key,
+                                    language=cfg.voice_speechcore_language,
+                                    diarize=cfg.voice_speechcore_diarize,
+                                )
+                            transcriber = state.speechcore_transcriber
+                    if transcriber is None and cfg.voice_transcription:
+                        if state.openai_transcriber is None:
+                            state.openai_transcriber = OpenAIVoiceTranscriber(
+                                base_url=cfg.voice_transcription_base_url,
+                                api_key=cfg.voice_transcription_api_key,
                             )
+                        transcriber = state.openai_transcriber
                     text = await transcribe_voice(
                         bot=cfg.bot,
                         msg=msg,
@@ -2007,4 +2023,8 @@ async def run_main_loop(
             async for update in poller_fn(cfg):
                 await route_update(update)
     finally:
+        if state.speechcore_transcriber is not None:
+            await state.speechcore_transcriber.aclose()
+        if state.openai_transcriber is not None:
+            await state.openai_transcriber.aclose()
         await cfg.exec_cfg.transport.close()
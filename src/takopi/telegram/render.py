@@ -16,6 +16,14 @@ _BULLET_RE = re.compile(r"(?m)^(\s*)•")
 _FENCE_RE = re.compile(r"^(?P<indent>[ \t]*)(?P<fence>[`~]{3,})(?P<info>.*)$")
 _ORDERED_ITEM_RE = re.compile(r"^(?P<indent>[ \t]{0,3})(?P<marker>\d+[.)])\s+")
 _UNORDERED_ITEM_RE = re.compile(r"^(?P<indent>[ \t]{0,3})[-+*]\s+")
+_PARAGRAPH_SPLIT_RE = re.compile(r"(\n{2,})")
+# Anything that could make markdown-it or sulguk do more than wrap paragraphs:
+# inline/block syntax, entities, control chars, whitespace that gets collapsed,
+# and line starts that may open a list, heading, or code block.
+_NON_PLAIN_RE = re.compile(
+    r"[*_`#\[\]<>|~\\&!\x00-\x09\x0b-\x1f\x7f]|[^\S \n]|  |^[ \d=+-]| $",
+    re.MULTILINE,
+)
 
 
 @dataclass(frozen=True, slots=True)
@@ -72,13 +80,33 @@ def _normalize_nested_list_markers(md: str) -> str:
     return "".join(lines)
 
 
-def render_markdown(md: str) -> tuple[str, list[dict[str, Any]]]:
-    html = _MD_RENDERER.render(_normalize_nested_list_markers(md or ""))
-    rendered = transform_html(html)
+def _render_plain(md: str) -> str | None:
+    if _NON_PLAIN_RE.search(md):
+        return None
+    stripped = md.strip("\n")
+    if not stripped:
+        return ""
+    paragraphs = [
+        " ".join(paragraph.split("\n"))
+        for paragraph in _PARAGRAPH_SPLIT_RE.split(stripped)[::2]
+    ]
+    return "\n\n".join(paragraphs) + "\n\n"
 
-    text = _BULLET_RE.sub(r"\1-", rendered.text)
 
-    entities = [dict(e) for e in rendered.entities]
+def render_markdown(md: str) -> tuple[str, list[dict[str, Any]]]:
+    md = md or ""
+    plain = _render_plain(md)
+    if plain is not None:
+        text = plain
+        entities: list[dict[str, Any]] = []
+    else:
+        html = _MD_RENDERER.render(_normalize_nested_list_markers(md))
+        rendered = transform_html(html)
+        text = rendered.text
+        entities = [dict(e) for e in rendered.entities]
+
+    if "•" in text:
+        text = _BULLET_RE.sub(r"\1-", text)
     return text, entities
 
 
@@ -142,6 +170,8 @@ def _update_fence_state(line: str, state: _FenceState | None) -> _FenceState | N
 
 
 def _scan_fence_state(text: str, state: _FenceState | None) -> _FenceState | None:
+    if "```" not in text and "~~~" not in text:
+        return state
     for line in text.splitlines():
         state = _update_fence_state(line, state)
     return state
@@ -165,7 +195,7 @@ def split_markdown_body(body: str, max_chars: int) -> list[str]:
     if not body or not body.strip():
         return []
     max_chars = max(1, int(max_chars))
-    segments = re.split(r"(\n{2,})", body)
+    segments = _PARAGRAPH_SPLIT_RE.split(body)
     blocks: list[str] = []
     for idx in range(0, len(segments), 2):
         paragraph = segments[idx]
@@ -33,7 +33,7 @@ class JsonStateStore[T: _VersionedState]:
         self._lock = anyio.Lock()
         self._loaded = False
         self._mtime_ns: int | None = None
-        self._state_type = state_type
+        self._decoder = msgspec.json.Decoder(state_type)
         self._state_factory = state_factory
         self._version = version
         self._log_prefix = log_prefix
@@ -59,9 +59,7 @@ class JsonStateStore[T: _VersionedState]:
             self._state = self._state_factory()
             return
         try:
-            payload = msgspec.json.decode(
-                self._path.read_bytes(), type=self._state_type
-            )
+            payload = self._decoder.decode(self._path.read_bytes())
         except Exception as exc:  # noqa: BLE001
             self._logger.warning(
                 f"{self._log_prefix}.load_failed",
@@ -83,6 +81,5 @@ class JsonStateStore[T: _VersionedState]:
         self._state = payload
 
     def _save_locked(self) -> None:
-        payload = msgspec.to_builtins(self._state)
-        atomic_write_json(self._path, payload)
+        atomic_write_json(self._path, self._state)
         self._mtime_ns = self._stat_mtime_ns()
@@ -1,21 +1,21 @@
 from __future__ import annotations
 
-import asyncio
 import io
 from collections.abc import Awaitable, Callable
 from typing import Protocol
 
+import anyio
 import httpx
-
-from ..logging import get_logger
+import msgspec
 from openai import AsyncOpenAI, OpenAIError
 
+from ..logging import get_logger
 from .client import BotClient
 from .types import TelegramIncomingMessage
 
 logger = get_logger(__name__)
 
-__all__ = ["transcribe_voice", "SpeechCoreTranscriber"]
+__all__ = ["OpenAIVoiceTranscriber", "SpeechCoreTranscriber", "transcribe_voice"]
 
 VOICE_TRANSCRIPTION_DISABLED_HINT = (
     "voice transcription is disabled. enable it in config:\n"
@@ -24,6 +24,11 @@ VOICE_TRANSCRIPTION_DISABLED_HINT = (
     "voice_transcription = true\n"
     "```"
 )
+VOICE_TOO_LARGE_TEXT = "voice message is too large to transcribe."
+
+SPEECHCORE_POLL_INITIAL_S = 0.5
+SPEECHCORE_POLL_MAX_S = 5.0
+SPEECHCORE_POLL_TIMEOUT_S = 600.0
 
 
 class VoiceTranscriber(Protocol):
@@ -39,19 +44,29 @@ class OpenAIVoiceTranscriber:
     ) -> None:
         self._base_url = base_url
         self._api_key = api_key
+        self._client: AsyncOpenAI | None = None
+
+    async def aclose(self) -> None:
+        if self._client is not None:
+            client, self._client = self._client, None
+            await client.close()
+
+    def _openai_client(self) -> AsyncOpenAI:
+        if self._client is None:
+            self._client = AsyncOpenAI(
+                base_url=self._base_url,
+                api_key=self._api_key,
+                timeout=120,
+            )
+        return self._client
 
     async def transcribe(self, *, model: str, audio_bytes: bytes) -> str:
         audio_file = io.BytesIO(audio_bytes)
         audio_file.name = "voice.ogg"
-        async with AsyncOpenAI(
-            base_url=self._base_url,
-            api_key=self._api_key,
-            timeout=120,
-        ) as client:
-            response = await client.audio.transcriptions.create(
-                model=model,
-                file=audio_file,
-            )
+        response = await self._openai_client().audio.transcriptions.create(
+            model=model,
+            file=audio_file,
+        )
         return response.text
 
 
@@ -70,9 +85,22 @@ class SpeechCoreTranscriber:
         self._api_key = api_key
         self._language = language
         self._diarize = diarize
+        self._client: httpx.AsyncClient | None = None
+
+    async def aclose(self) -> None:
+        if self._client is not None:
+            client, self._client = self._client, None
+            await client.aclose()
+
+    def _http_client(self) -> httpx.AsyncClient:
+        if self._client is None:
+            self._client = httpx.AsyncClient(
+                timeout=300.0,
+                headers={"Authorization": f"Bearer {self._api_key}"},
+            )
+        return self._client
 
     async def transcribe(self, *, model: str, audio_bytes: bytes) -> str:
-        headers = {"Authorization": f"Bearer {self._api_key}"}
         # Always use large-v3 for SpeechCore (ignore OpenAI model name)
         params = {
             "model": "large-v3",
@@ -80,58 +108,57 @@ class SpeechCoreTranscriber:
             "diarize": str(self._diarize).lower(),
         }
 
-        async with httpx.AsyncClient(timeout=300.0) as client:
-            # 1. Upload audio file
-            files = {"file": ("voice.ogg", io.BytesIO(audio_bytes), "audio/ogg")}
-            upload_resp = await client.post(
-                f"{self.BASE_URL}/upload",
-                headers=headers,
-                params=params,
-                files=files,
+        client = self._http_client()
+        # 1. Upload audio file
+        files = {"file": ("voice.ogg", io.BytesIO(audio_bytes), "audio/ogg")}
+        upload_resp = await client.post(
+            f"{self.BASE_URL}/upload",
+            params=params,
+            files=files,
+        )
+        upload_resp.raise_for_status()
+        task_id = msgspec.json.decode(upload_resp.content)["task_id"]
+        logger.info("speechcore.upload.success", task_id=task_id)
+
+        # 2. Poll for completion, backing off from short to 5s intervals
+        deadline = anyio.current_time() + SPEECHCORE_POLL_TIMEOUT_S
+        delay = SPEECHCORE_POLL_INITIAL_S
+        while True:
+            status_resp = await client.get(
+                f"{self.BASE_URL}/transcriptions/{task_id}/status"
             )
-            upload_resp.raise_for_status()
-            task_id = upload_resp.json()["task_id"]
-            logger.info("speechcore.upload.success", task_id=task_id)
-
-            # 2. Poll for completion
-            max_polls = 120  # 10 minutes max
-            for _ in range(max_polls):
-                status_resp = await client.get(
-                    f"{self.BASE_URL}/transcriptions/{task_id}/status",
-                    headers=headers,
-                )
-                status_resp.raise_for_status()
-                status_data = status_resp.json()
-                status = status_data.get("status")
-
-                if status == "completed":
-                    break
-                elif status == "failed":
-                    error = status_data.get("error", "Unknown error")
-                    raise RuntimeError(f"SpeechCore transcription failed: {error}")
-
-                await asyncio.sleep(5)
-            else:
+            status_resp.raise_for_status()
+            status_data = msgspec.json.decode(status_resp.content)
+            status = status_data.get("status")
+
+            if status == "completed":
+                break
+            elif status == "failed":
+                error = status_data.get("error", "Unknown error")
+                raise RuntimeError(f"SpeechCore transcription failed: {error}")
+
+            if anyio.current_time() + delay > deadline:
                 raise RuntimeError("SpeechCore transcription timed out")
+            await anyio.sleep(delay)
+            delay = min(SPEECHCORE_POLL_MAX_S, delay * 1.5)
 
-            # 3. Get transcription result
-            result_resp = await client.get(
-                f"{self.BASE_URL}/transcriptions/{task_id}",
-                headers=headers,
-            )
-            result_resp.raise_for_status()
-            result = result_resp.json()
+        # 3. Get transcription result
+        result_resp = await client.get(f"{self.BASE_URL}/transcriptions/{task_id}")
+        result_resp.raise_for_status()
+        result = msgspec.json.decode(result_resp.content)
 
-            # Extract text from result
-            text = result.get("text", "")
-            if not text and "segments" in result:
-                # Fallback: join segment texts
-                text = " ".join(
-                    seg.get("text", "") for seg in result.get("segments", [])
-                )
+        # Extract text from result
+        text = result.get("text", "")
+        if not text and "segments" in result:
+            # Fallback: join segment texts
+            text = " ".join(seg.get("text", "") for seg in result.get("segments", []))
 
-            logger.info("speechcore.transcribe.success", task_id=task_id)
-            return text.strip()
+        logger.info("speechcore.transcribe.success", task_id=task_id)
+        return text.strip()
+
+
+def _too_large(size: int | None, max_bytes: int | None) -> bool:
+    return max_bytes is not None and size is not None and size > max_bytes
 
 
 async def transcribe_voice(
@@ -152,26 +179,28 @@ async def transcribe_voice(
     if not enabled:
         await reply(text=VOICE_TRANSCRIPTION_DISABLED_HINT)
         return None
-    if (
-        max_bytes is not None
-        and voice.file_size is not None
-        and voice.file_size > max_bytes
-    ):
-        await reply(text="voice message is too large to transcribe.")
+    file_size = voice.file_size
+    if _too_large(file_size, max_bytes):
+        await reply(text=VOICE_TOO_LARGE_TEXT)
         return None
     file_info = await bot.get_file(voice.file_id)
     if file_info is None:
         await reply(text="failed to fetch voice file.")
         return None
+    file_size = file_info.file_size
+    if _too_large(file_size, max_bytes):
+        await reply(text=VOICE_TOO_LARGE_TEXT)
+        return None
     audio_bytes = await bot.download_file(file_info.file_path)
     if audio_bytes is None:
         await reply(text="failed to download voice file.")
         return None
-    if max_bytes is not None and len(audio_bytes) > max_bytes:
-        await reply(text="voice message is too large to transcribe.")
+    if _too_large(len(audio_bytes), max_bytes):
+        await reply(text=VOICE_TOO_LARGE_TEXT)
         return None
+    owned: OpenAIVoiceTranscriber | None = None
     if transcriber is None:
-        transcriber = OpenAIVoiceTranscriber(base_url=base_url, api_key=api_key)
+        transcriber = owned = OpenAIVoiceTranscriber(base_url=base_url, api_key=api_key)
     try:
         return await transcriber.transcribe(model=model, audio_bytes=audio_bytes)
     except OpenAIError as exc:
@@ -190,3 +219,6 @@ async def transcribe_voice(
         )
         await reply(text=str(exc).strip() or "voice transcription failed")
         return None
+    finally:
+        if owned is not None:
+            await owned.aclose()
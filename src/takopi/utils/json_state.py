@@ -1,10 +1,11 @@
 from __future__ import annotations
 
-import json
 import os
 from pathlib import Path
 from typing import Any
 
+import msgspec
+
 
 def atomic_write_json(
     path: Path,
@@ -13,9 +14,10 @@ def atomic_write_json(
     indent: int = 2,
     sort_keys: bool = True,
 ) -> None:
+    encoded = msgspec.json.encode(payload, order="sorted" if sort_keys else None)
     path.parent.mkdir(parents=True, exist_ok=True)
     tmp_path = path.with_suffix(f"{path.suffix}.tmp")
-    with open(tmp_path, "w", encoding="utf-8") as handle:
-        json.dump(payload, handle, indent=indent, sort_keys=sort_keys)
-        handle.write("\n")
+    with open(tmp_path, "wb") as handle:
+        handle.write(msgspec.json.format(encoded, indent=indent))
+        handle.write(b"\n")
     os.replace(tmp_path, path)
@@ -6,6 +6,7 @@ from pathlib import Path
 
 
 _run_base_dir: ContextVar[Path | None] = ContextVar("takopi_run_base_dir", default=None)
+_PATH_SEPS: tuple[str, ...] = (os.sep,) if os.sep == "/" else (os.sep, "/")
 
 
 def get_run_base_dir() -> Path | None:
@@ -31,7 +32,7 @@ def relativize_path(value: str, *, base_dir: Path | None = None) -> str:
         return value
     if value == base_str:
         return "."
-    for sep in (os.sep, "/"):
+    for sep in _PATH_SEPS:
         prefix = base_str if base_str.endswith(sep) else f"{base_str}{sep}"
         if value.startswith(prefix):
             suffix = value[len(prefix) :]
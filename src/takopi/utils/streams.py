@@ -1,24 +1,35 @@
 from __future__ import annotations
 
 from collections.abc import AsyncIterator
-import sys
 from typing import Any
 
 import anyio
 from anyio.abc import ByteReceiveStream
-from anyio.streams.buffered import BufferedByteReceiveStream
 
-from ..logging import log_pipeline
+from ..logging import log_pipeline, pipeline_enabled
 
 
 async def iter_bytes_lines(stream: ByteReceiveStream) -> AsyncIterator[bytes]:
-    buffered = BufferedByteReceiveStream(stream)
+    pending = bytearray()
     while True:
         try:
-            line = await buffered.receive_until(b"\n", sys.maxsize)
-        except anyio.IncompleteRead:
+            chunk = await stream.receive()
+        except anyio.EndOfStream:
             return
-        yield line
+        newline = chunk.rfind(b"\n")
+        if newline < 0:
+            pending += chunk
+            continue
+        if pending:
+            pending += chunk[:newline]
+            complete = bytes(pending)
+            pending.clear()
+        else:
+            complete = chunk[:newline]
+        if newline + 1 < len(chunk):
+            pending += chunk[newline + 1 :]
+        for line in complete.split(b"\n"):
+            yield line
 
 
 async def drain_stderr(
@@ -28,6 +39,8 @@ async def drain_stderr(
 ) -> None:
     try:
         async for line in iter_bytes_lines(stream):
+            if not pipeline_enabled():
+                continue
             text = line.decode("utf-8", errors="replace")
             log_pipeline(
                 logger,
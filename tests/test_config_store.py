@@ -20,6 +20,26 @@ def test_read_write_config_round_trip(tmp_path: Path) -> None:
     assert loaded == payload
 
 
+def test_read_config_returns_independent_copies(tmp_path: Path) -> None:
+    config_path = tmp_path / "takopi.toml"
+    write_config({"projects": {"z80": {"path": "/tmp/repo"}}}, config_path)
+
+    first = read_config(config_path)
+    first["projects"]["z80"]["path"] = "/elsewhere"
+
+    assert read_config(config_path) == {"projects": {"z80": {"path": "/tmp/repo"}}}
+
+
+def test_read_config_sees_rewritten_file(tmp_path: Path) -> None:
+    config_path = tmp_path / "takopi.toml"
+    write_config({"default_engine": "codex"}, config_path)
+    assert read_config(config_path) == {"default_engine": "codex"}
+
+    write_config({"default_engine": "claude"}, config_path)
+
+    assert read_config(config_path) == {"default_engine": "claude"}
+
+
 def test_read_config_missing_file(tmp_path: Path) -> None:
     config_path = tmp_path / "missing.toml"
     with pytest.raises(ConfigError, match="Missing config file"):
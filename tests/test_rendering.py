@@ -13,6 +13,13 @@ def test_render_markdown_basic_entities() -> None:
     ]
 
 
+def test_render_markdown_plain_text_matches_full_render() -> None:
+    text, entities = render_markdown("done.\nall good\n\n\nnext step")
+
+    assert text == "done. all good\n\nnext step\n\n"
+    assert entities == []
+
+
 def test_render_markdown_code_fence_language_is_string() -> None:
     text, entities = render_markdown("```py\nprint('x')\n```")
 
@@ -2,7 +2,9 @@ import re
 from collections.abc import AsyncIterator
 from typing import Any
 
+import anyio
 import pytest
+from anyio.abc import ByteReceiveStream
 
 import takopi.runner as runner_module
 from takopi.model import (
@@ -18,6 +20,7 @@ from takopi.runner import (
     JsonlSubprocessRunner,
     ResumeTokenMixin,
 )
+from takopi.utils.streams import iter_bytes_lines
 
 
 class _DummyRunner(ResumeTokenMixin, BaseRunner):
@@ -242,9 +245,14 @@ def test_jsonl_helpers() -> None:
     invalid_event = invalid[0]
     assert isinstance(invalid_event, ActionEvent)
     assert invalid_event.action.detail["line"] == "{}"
+    long_invalid = runner.invalid_json_events(raw="x", line="x" * 500, state=state)
+    assert isinstance(long_invalid[0], ActionEvent)
+    assert len(long_invalid[0].action.detail["line"]) == 200
 
     assert runner.decode_jsonl(line=b'{"a": 1}') == {"a": 1}
     assert runner.decode_jsonl(line=b"{") is None
+    assert runner.decode_jsonl(line=b"starting up...") is None
+    assert runner.decode_jsonl(line=b'{"t": "caf\xc3"}') == {"t": "caf\ufffd"}
 
     err_events = runner.decode_error_events(
         raw="oops", line="{}", error=ValueError("nope"), state=state
@@ -413,3 +421,23 @@ async def test_jsonl_run_impl_branches(monkeypatch: pytest.MonkeyPatch) -> None:
     runner = _BranchingJsonlRunner()
     events = [evt async for evt in runner.run_impl("hello", None)]
     assert any(isinstance(evt, CompletedEvent) for evt in events)
+
+
+@pytest.mark.anyio
+async def test_iter_bytes_lines_splits_chunks_and_drops_partial_tail() -> None:
+    class _ChunkStream(ByteReceiveStream):
+        def __init__(self, chunks: list[bytes]) -> None:
+            self._chunks = list(chunks)
+
+        async def receive(self, max_bytes: int = 65536) -> bytes:
+            if not self._chunks:
+                raise anyio.EndOfStream
+            return self._chunks.pop(0)
+
+        async def aclose(self) -> None:
+            self._chunks.clear()
+
+    stream = _ChunkStream([b'{"a"', b": 1}\n{}\n\n{", b'"b": 2}\n', b"tail"])
+    lines = [line async for line in iter_bytes_lines(stream)]
+
+    assert lines == [b'{"a": 1}', b"{}", b"", b'{"b": 2}']
@@ -73,6 +73,24 @@ def test_legacy_keys_migrated(tmp_path: Path) -> None:
     assert raw["transport"] == "telegram"
 
 
+def test_legacy_keys_migrated_after_rewrite(tmp_path: Path) -> None:
+    config_path = tmp_path / "takopi.toml"
+    config_path.write_text(
+        'transport = "telegram"\n\n'
+        "[transports.telegram]\n"
+        'bot_token = "token"\n'
+        "chat_id = 123\n",
+        encoding="utf-8",
+    )
+    load_settings(config_path)
+
+    config_path.write_text('bot_token = "token"\nchat_id = 456\n', encoding="utf-8")
+    settings, _ = load_settings(config_path)
+
+    assert settings.transports.telegram.chat_id == 456
+    assert "chat_id" not in read_config(config_path)
+
+
 def test_validate_settings_data_rejects_invalid_bot_token_type(tmp_path: Path) -> None:
     config_path = tmp_path / "takopi.toml"
     data = {
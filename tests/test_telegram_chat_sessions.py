@@ -3,6 +3,7 @@ from pathlib import Path
 import pytest
 
 from takopi.model import ResumeToken
+from takopi.telegram import chat_sessions
 from takopi.telegram.chat_sessions import ChatSessionStore
 
 
@@ -67,3 +68,85 @@ async def test_chat_sessions_store_drops_sessions_on_cwd_change(
     store3 = ChatSessionStore(path)
     assert await store3.sync_startup_cwd(Path.cwd()) is True
     assert await store3.get_session_resume(1, None, "codex") is None
+
+
+@pytest.mark.anyio
+async def test_chat_sessions_store_prunes_oldest_per_engine(
+    tmp_path, monkeypatch
+) -> None:
+    clock = iter(range(1, 1000))
+    monkeypatch.setattr(chat_sessions, "time", lambda: float(next(clock)))
+    store = ChatSessionStore(tmp_path / "telegram_chat_sessions_state.json")
+    await store.set_session_resume(1, None, ResumeToken(engine="claude", value="c"))
+    for idx in range(chat_sessions.MAX_SESSIONS_PER_CHAT + 2):
+        await store.set_session_resume(
+            1, None, ResumeToken(engine="codex", value=f"s{idx}")
+        )
+
+    codex = await store.list_sessions(1, None, "codex")
+    assert len(codex) == chat_sessions.MAX_SESSIONS_PER_CHAT
+    assert {s.resume for s in codex}.isdisjoint({"s0", "s1"})
+    assert [s.resume for s in await store.list_sessions(1, None, "claude")] == ["c"]
+
+
+@pytest.mark.anyio
+async def test_chat_sessions_store_migrates_legacy_sessions_on_load(
+    tmp_path,
+) -> None:
+    path = tmp_path / "telegram_chat_sessions_state.json"
+    path.write_text(
+        '{"version": 2, "chats": {"1:chat": {"sessions": {"codex": {"resume": "old"}}}}}'
+    )
+    store = ChatSessionStore(path)
+
+    assert await store.get_session_resume(1, None, "codex") == ResumeToken(
+        engine="codex", value="old"
+    )
+    assert await store.get_active_session_id(1, None, "codex") == "old"
+
+
+@pytest.mark.anyio
+async def test_chat_sessions_store_skips_noop_writes(tmp_path, monkeypatch) -> None:
+    store = ChatSessionStore(tmp_path / "telegram_chat_sessions_state.json")
+    await store.set_session_resume(1, None, ResumeToken(engine="codex", value="abc"))
+    await store.clear_sessions(1, None)
+
+    saves: list[None] = []
+    monkeypatch.setattr(store, "_save_locked", lambda: saves.append(None))
+    await store.clear_sessions(1, None)
+    await store.new_session(1, None, "codex")
+
+    assert saves == []
+
+
+@pytest.mark.anyio
+async def test_chat_sessions_store_sessions_overview(tmp_path) -> None:
+    store = ChatSessionStore(tmp_path / "telegram_chat_sessions_state.json")
+    assert await store.get_sessions_overview(1, None) == ([], {})
+
+    await store.set_session_resume(1, None, ResumeToken(engine="codex", value="a"))
+    await store.set_session_resume(1, None, ResumeToken(engine="claude", value="b"))
+    await store.new_session(1, None, "claude")
+
+    sessions, active = await store.get_sessions_overview(1, None)
+    assert sessions == await store.list_sessions(1, None)
+    assert active == {"codex": "a"}
+    codex_sessions, _ = await store.get_sessions_overview(1, None, engine="codex")
+    assert [s.resume for s in codex_sessions] == ["a"]
+
+
+@pytest.mark.anyio
+async def test_chat_sessions_store_find_sessions_by_prefix(tmp_path) -> None:
+    store = ChatSessionStore(tmp_path / "telegram_chat_sessions_state.json")
+    for value in ("abc1", "abc2", "xyz"):
+        await store.set_session_resume(
+            1, None, ResumeToken(engine="codex", value=value)
+        )
+
+    assert [s.resume for s in await store.find_sessions_by_prefix(1, None, "x")] == [
+        "xyz"
+    ]
+    assert len(await store.find_sessions_by_prefix(1, None, "abc")) == 2
+    assert len(await store.find_sessions_by_prefix(1, None, "abc", limit=1)) == 1
+    assert await store.find_sessions_by_prefix(1, None, "nope") == []
+    assert await store.find_sessions_by_prefix(2, None, "abc") == []
@@ -176,3 +176,20 @@ async def test_decode_result_invalid_payload_returns_none() -> None:
     client = HttpBotClient("token", http_client=httpx.AsyncClient())
     assert client._decode_result(method="getMe", payload=["bad"], model=User) is None
     await client.close()
+
+
+@pytest.mark.anyio
+async def test_request_decodes_json_body() -> None:
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.url.path.endswith("/getMe"):
+            return httpx.Response(200, content=b'{"ok":true,"result":{"id":7}}')
+        return httpx.Response(200, content=b"not json")
+
+    http_client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    client = HttpBotClient("token", http_client=http_client)
+
+    me = await client.get_me()
+    assert me is not None and me.id == 7
+    assert await client.get_chat(1) is None
+
+    await http_client.aclose()
@@ -0,0 +1,165 @@
+from __future__ import annotations
+
+import json
+import os
+import shutil
+from pathlib import Path
+
+import anyio
+import anyio.lowlevel
+import pytest
+
+from takopi.context import RunContext
+from takopi.model import ResumeToken
+from takopi.telegram import inject
+from takopi.telegram.inject import SYSTEM_PREFIX, watch_inject_dir
+
+POLL_INTERVAL = 0.01
+
+
+class _Logger:
+    def __init__(self) -> None:
+        self.errors: list[str] = []
+
+    def info(self, event: str, **fields: object) -> None:
+        pass
+
+    def warning(self, event: str, **fields: object) -> None:
+        pass
+
+    def exception(self, event: str, **fields: object) -> None:
+        self.errors.append(event)
+
+
+class _Watcher:
+    def __init__(self, inject_dir: Path) -> None:
+        self.inject_dir = inject_dir
+        self.prompts: list[str] = []
+        self.cleared: list[int] = []
+
+    async def run_job(
+        self,
+        chat_id: int,
+        user_msg_id: int,
+        text: str,
+        resume_token: ResumeToken | None,
+        context: RunContext | None,
+    ) -> None:
+        self.prompts.append(text)
+
+    async def get_resume(self, chat_id: int) -> ResumeToken | None:
+        return None
+
+    async def clear_session(self, chat_id: int) -> None:
+        self.cleared.append(chat_id)
+
+    async def run(self) -> None:
+        await watch_inject_dir(
+            inject_dir=self.inject_dir,
+            chat_id=1,
+            poll_interval=POLL_INTERVAL,
+            run_job=self.run_job,
+            get_resume=self.get_resume,
+            clear_session=self.clear_session,
+        )
+
+
+async def _polls(count: int = 5) -> None:
+    await anyio.sleep(POLL_INTERVAL * count)
+
+
+def _drop(inject_dir: Path, name: str, payload: object) -> None:
+    (inject_dir / name).write_text(json.dumps(payload))
+
+
+def _set_mtime(path: Path, mtime_ns: int) -> None:
+    os.utime(path, ns=(mtime_ns, mtime_ns))
+
+
+@pytest.fixture
+def logger(monkeypatch) -> _Logger:
+    fake = _Logger()
+    monkeypatch.setattr(inject, "logger", fake)
+    return fake
+
+
+@pytest.mark.anyio
+async def test_watch_inject_dir_picks_up_file_after_dir_settles(
+    tmp_path, logger
+) -> None:
+    inject_dir = tmp_path / "inject"
+    watcher = _Watcher(inject_dir)
+    async with anyio.create_task_group() as tg:
+        tg.start_soon(watcher.run)
+        await _polls()
+        settled_ns = inject_dir.stat().st_mtime_ns
+
+        _drop(inject_dir, "a.json", {"text": "hello"})
+        _set_mtime(inject_dir, settled_ns + 1_000_000_000)
+        await _polls()
+        tg.cancel_scope.cancel()
+
+    assert watcher.prompts == [f"{SYSTEM_PREFIX}hello"]
+    assert list(inject_dir.iterdir()) == []
+    assert logger.errors == []
+
+
+@pytest.mark.anyio
+async def test_watch_inject_dir_rescans_when_mtime_does_not_move(
+    tmp_path, logger
+) -> None:
+    inject_dir = tmp_path / "inject"
+    inject_dir.mkdir()
+    _drop(inject_dir, "a.json", {"text": "first"})
+    watcher = _Watcher(inject_dir)
+    async with anyio.create_task_group() as tg:
+        tg.start_soon(watcher.run)
+        while not watcher.prompts:
+            await anyio.lowlevel.checkpoint()
+        scanned_ns = inject_dir.stat().st_mtime_ns
+
+        # A file created in the same timestamp tick as the first scan.
+        _drop(inject_dir, "b.json", {"text": "second"})
+        _set_mtime(inject_dir, scanned_ns)
+        await _polls()
+        tg.cancel_scope.cancel()
+
+    assert watcher.prompts == [f"{SYSTEM_PREFIX}first", f"{SYSTEM_PREFIX}second"]
+    assert logger.errors == []
+
+
+@pytest.mark.anyio
+async def test_watch_inject_dir_waits_quietly_for_missing_dir(tmp_path, logger) -> None:
+    inject_dir = tmp_path / "inject"
+    watcher = _Watcher(inject_dir)
+    async with anyio.create_task_group() as tg:
+        tg.start_soon(watcher.run)
+        await _polls()
+        shutil.rmtree(inject_dir)
+        await _polls()
+
+        inject_dir.mkdir()
+        _drop(inject_dir, "a.json", {"text": "back"})
+        await _polls()
+        tg.cancel_scope.cancel()
+
+    assert watcher.prompts == [f"{SYSTEM_PREFIX}back"]
+    assert logger.errors == []
+
+
+@pytest.mark.anyio
+async def test_watch_inject_dir_treats_new_session_as_truthy(tmp_path, logger) -> None:
+    inject_dir = tmp_path / "inject"
+    inject_dir.mkdir()
+    _drop(inject_dir, "a.json", {"text": "one", "new_session": None})
+    _drop(inject_dir, "b.json", {"text": "two", "new_session": 1})
+    _drop(inject_dir, "c.json", {"text": "three", "new_session": "true"})
+    watcher = _Watcher(inject_dir)
+    async with anyio.create_task_group() as tg:
+        tg.start_soon(watcher.run)
+        await _polls()
+        tg.cancel_scope.cancel()
+
+    assert len(watcher.prompts) == 3
+    assert watcher.cleared == [1, 1]
+    assert list(inject_dir.iterdir()) == []
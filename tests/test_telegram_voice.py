@@ -1,7 +1,9 @@
 from __future__ import annotations
 
+import httpx
 import pytest
 
+from takopi.telegram import voice as voice_module
 from takopi.telegram.api_models import (
     Chat,
     ChatMember,
@@ -13,7 +15,12 @@ from takopi.telegram.api_models import (
 )
 from takopi.telegram.client import BotClient
 from takopi.telegram.types import TelegramIncomingMessage, TelegramVoice
-from takopi.telegram.voice import VOICE_TRANSCRIPTION_DISABLED_HINT, transcribe_voice
+from takopi.telegram.voice import (
+    VOICE_TRANSCRIPTION_DISABLED_HINT,
+    OpenAIVoiceTranscriber,
+    SpeechCoreTranscriber,
+    transcribe_voice,
+)
 
 
 class _Bot(BotClient):
@@ -155,7 +162,7 @@ class _Bot(BotClient):
         raise AssertionError("edit_forum_topic should not be called")
 
 
-def _voice_message(*, file_size: int = 123) -> TelegramIncomingMessage:
+def _voice_message(*, file_size: int | None = 123) -> TelegramIncomingMessage:
     voice = TelegramVoice(
         file_id="voice-id",
         mime_type="audio/ogg",
@@ -282,6 +289,34 @@ async def test_transcribe_voice_rejects_large_voice_without_downloading() -> Non
     assert replies[-1] == "voice message is too large to transcribe."
 
 
+@pytest.mark.anyio
+async def test_transcribe_voice_rejects_large_file_info_without_downloading() -> None:
+    replies: list[str] = []
+
+    async def reply(**kwargs) -> None:
+        replies.append(kwargs["text"])
+
+    class _NoDownloadBot(_Bot):
+        async def download_file(self, file_path: str) -> bytes | None:  # type: ignore[override]
+            _ = file_path
+            raise AssertionError("download_file should not be called")
+
+    bot = _NoDownloadBot(
+        file_info=File(file_path="voice.ogg", file_size=10_000), audio=None
+    )
+    result = await transcribe_voice(
+        bot=bot,
+        msg=_voice_message(file_size=None),
+        enabled=True,
+        model="whisper-1",
+        max_bytes=100,
+        reply=reply,
+    )
+
+    assert result is None
+    assert replies[-1] == "voice message is too large to transcribe."
+
+
 @pytest.mark.anyio
 async def test_transcribe_voice_rejects_large_download() -> None:
     replies: list[str] = []
@@ -350,3 +385,95 @@ async def test_transcribe_voice_success() -> None:
     assert result == "transcribed"
     assert replies == []
     assert transcriber.calls
+
+
+@pytest.mark.anyio
+async def test_speechcore_transcriber_reuses_http_client(monkeypatch) -> None:
+    requests: list[httpx.Request] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        if request.url.path.endswith("/upload"):
+            return httpx.Response(200, json={"task_id": "t1"})
+        if request.url.path.endswith("/status"):
+            return httpx.Response(200, json={"status": "completed"})
+        return httpx.Response(200, json={"text": " hello "})
+
+    clients: list[httpx.AsyncClient] = []
+    real_client = httpx.AsyncClient
+
+    def make_client(**kwargs) -> httpx.AsyncClient:
+        client = real_client(transport=httpx.MockTransport(handler), **kwargs)
+        clients.append(client)
+        return client
+
+    monkeypatch.setattr(httpx, "AsyncClient", make_client)
+    transcriber = SpeechCoreTranscriber(api_key="key")
+
+    assert await transcriber.transcribe(model="whisper-1", audio_bytes=b"a") == "hello"
+    assert await transcriber.transcribe(model="whisper-1", audio_bytes=b"b") == "hello"
+    await transcriber.aclose()
+
+    assert len(clients) == 1
+    assert clients[0].is_closed
+    assert len(requests) == 6
+    assert all(r.headers["Authorization"] == "Bearer key" for r in requests)
+
+
+@pytest.mark.anyio
+async def test_openai_transcriber_reuses_client(monkeypatch) -> None:
+    clients: list[_FakeOpenAI] = []
+
+    class _Response:
+        text = "hello"
+
+    class _FakeOpenAI:
+        def __init__(self, **kwargs) -> None:
+            self.kwargs = kwargs
+            self.closed = False
+            self.audio = self
+            self.transcriptions = self
+            clients.append(self)
+
+        async def create(self, *, model: str, file) -> _Response:
+            return _Response()
+
+        async def close(self) -> None:
+            self.closed = True
+
+    monkeypatch.setattr(voice_module, "AsyncOpenAI", _FakeOpenAI)
+    transcriber = OpenAIVoiceTranscriber(base_url="http://x", api_key="key")
+
+    assert await transcriber.transcribe(model="whisper-1", audio_bytes=b"a") == "hello"
+    assert await transcriber.transcribe(model="whisper-1", audio_bytes=b"b") == "hello"
+    await transcriber.aclose()
+
+    assert len(clients) == 1
+    assert clients[0].closed
+    assert clients[0].kwargs["api_key"] == "key"
+
+
+@pytest.mark.anyio
+async def test_speechcore_transcriber_backs_off_while_polling(monkeypatch) -> None:
+    statuses = iter(["queued", "processing", "processing", "completed"])
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.url.path.endswith("/upload"):
+            return httpx.Response(200, json={"task_id": "t1"})
+        if request.url.path.endswith("/status"):
+            return httpx.Response(200, json={"status": next(statuses)})
+        return httpx.Response(200, json={"segments": [{"text": "a"}, {"text": "b"}]})
+
+    delays: list[float] = []
+
+    async def fake_sleep(delay: float) -> None:
+        delays.append(delay)
+
+    monkeypatch.setattr(voice_module.anyio, "sleep", fake_sleep)
+    transcriber = SpeechCoreTranscriber(api_key="key")
+    transcriber._client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+
+    assert await transcriber.transcribe(model="whisper-1", audio_bytes=b"a") == "a b"
+    await transcriber.aclose()
+
+    assert delays == [0.5, 0.75, 1.125]